@@ -15,10 +15,11 @@ Purpose:
 """
 
 from dataclasses import dataclass
-from typing import Dict
 
+import immutables
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AgentSpec:
     """
     Canonical description of an agent.
@@ -37,7 +38,9 @@ class AgentSpec:
 # Core ASMA Agents
 # ---------------------------------------------------------------------------
 
-AGENTS: Dict[str, AgentSpec] = {
+# Frozen HAMT: the registry is a constant read on every routing decision,
+# so an immutable map gives cheap lookups and rules out accidental mutation.
+AGENTS: immutables.Map[str, AgentSpec] = immutables.Map({
     "SOL": AgentSpec(
         code="SOL",
         title="Architect",
@@ -58,6 +61,6 @@ AGENTS: Dict[str, AgentSpec] = {
         title="Creative Generator",
         scope="Produces variations and options without changing final decisions."
     ),
-}
+})
 
 __all__ = ["AgentSpec", "AGENTS"]
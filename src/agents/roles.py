@@ -10,11 +10,14 @@ There is no lore, no personality layer, and no provider-specific coupling.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List
+import functools
+from dataclasses import dataclass
+from typing import Tuple
 
+import immutables
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AgentRole:
     """
     Declarative description of an agent role inside a HITL multi-agent system.
@@ -28,7 +31,7 @@ class AgentRole:
     key: str  # short identifier used by the router (e.g. "architect")
     title: str  # human-facing label
     purpose: str  # one-line summary of why this role exists
-    responsibilities: List[str] = field(default_factory=list)
+    responsibilities: Tuple[str, ...] = ()
     escalation_policy: str = ""
     allow_autonomous_actions: bool = False  # if False → human approval required
 
@@ -41,24 +44,29 @@ class AgentRole:
         return not self.allow_autonomous_actions
 
 
-def default_roles() -> Dict[str, AgentRole]:
+@functools.lru_cache(maxsize=1)
+def default_roles() -> immutables.Map[str, AgentRole]:
     """
     Return the default set of agent roles used by the router.
 
-    Keys in the returned dict are stable identifiers that can be referenced
-    in configuration files, tests, or orchestration logic.
+    The registry is fully immutable (map, frozen dataclasses, tuples), so it
+    is built once and cached; every router startup reuses the same instance.
+
+    Keys in the returned map are stable identifiers that can be referenced
+    in configuration files, tests, or orchestration logic. The registry is
+    returned as an immutable map so callers cannot mutate shared state.
     """
-    return {
+    return immutables.Map({
         "architect": AgentRole(
             key="architect",
             title="Architect Agent",
             purpose="Decompose user goals into a governed, testable plan.",
-            responsibilities=[
+            responsibilities=(
                 "Clarify the user goal and constraints.",
                 "Break work into discrete, routable steps.",
                 "Assign proposed steps to roles without executing them.",
                 "Document assumptions for human review.",
-            ],
+            ),
             escalation_policy=(
                 "Escalate to a human whenever requirements are ambiguous, "
                 "conflicting, or outside the declared scope of the system."
@@ -69,11 +77,11 @@ def default_roles() -> Dict[str, AgentRole]:
             key="validator",
             title="Validator Agent",
             purpose="Check agent outputs against schemas and governance rules.",
-            responsibilities=[
+            responsibilities=(
                 "Validate structure against expected schemas.",
                 "Flag missing fields, type mismatches, or policy violations.",
                 "Summarize issues in plain language for the human reviewer.",
-            ],
+            ),
             escalation_policy=(
                 "Fail closed on uncertainty. When in doubt, require a human "
                 "decision instead of silently accepting output."
@@ -84,11 +92,11 @@ def default_roles() -> Dict[str, AgentRole]:
             key="risk",
             title="Risk & Safety Agent",
             purpose="Scan content for risk, overreach, or policy conflict.",
-            responsibilities=[
+            responsibilities=(
                 "Detect unsafe, non-compliant, or high-risk recommendations.",
                 "Highlight language that overstates certainty or guarantees.",
                 "Propose safer alternatives without executing them.",
-            ],
+            ),
             escalation_policy=(
                 "Route any medium or high-risk findings to a human approver. "
                 "Never auto-execute actions that change external state."
@@ -99,21 +107,21 @@ def default_roles() -> Dict[str, AgentRole]:
             key="creative",
             title="Creative Agent",
             purpose="Generate options, drafts, and variations within constraints.",
-            responsibilities=[
+            responsibilities=(
                 "Produce alternative drafts or solution options.",
                 "Stay within the brief, schemas, and routing constraints.",
                 "Label speculative content clearly as exploratory.",
-            ],
+            ),
             escalation_policy=(
                 "All creative outputs are treated as drafts. A human or "
                 "validator must approve before anything is executed or published."
             ),
             allow_autonomous_actions=False,
         ),
-    }
+    })
 
 
-def get_role_registry() -> Dict[str, AgentRole]:
+def get_role_registry() -> immutables.Map[str, AgentRole]:
     """
     Convenience accessor used by the router to obtain the role registry.
 
@@ -63,3 +63,43 @@ def test_route_produces_audit_record():
     assert getattr(audit.decision, "allowed") in {True, False}
     assert isinstance(getattr(audit, "correlation_id"), str)
     assert getattr(audit, "correlation_id")
+
+
+def test_ledger_hash_chain_detects_tampering():
+    """
+    The ledger hash chain should verify on a clean ledger and fail once
+    any logged record is mutated after the fact.
+    """
+    module = _get_router_module()
+    router = module.HITLRouter()
+
+    for content in ("first step", "second step", "third step"):
+        proposal = router.normalize(module.AgentRole.SOL, content)
+        assert router.route(proposal)["status"] == "approved"
+
+    assert router.verify_chain()
+
+    # Rewrite an already-logged record; every later hash is now invalid.
+    router._contents[1] = "rewritten"
+    assert not router.verify_chain()
+
+
+def test_route_many_matches_route():
+    """
+    route_many() must return the same verdicts route() would produce,
+    including when pipeline stages are disabled via constructor toggles.
+    """
+    module = _get_router_module()
+
+    def proposals(router):
+        return [
+            router.normalize(module.AgentRole.SOL, "plan the build"),
+            router.normalize(module.AgentRole.MUSE, "we guarantee results"),
+            module.AgentProposal(role="not-a-role", content="x"),
+        ]
+
+    for kwargs in ({}, {"risk_enabled": False}, {"review_enabled": False}):
+        single = module.HITLRouter(**kwargs)
+        batch = module.HITLRouter(**kwargs)
+        expected = [single.route(p) for p in proposals(single)]
+        assert batch.route_many(proposals(batch)) == expected